@@ -60,24 +60,35 @@ class SocketReceive(commands.Cog):
         name = ctx.name
 
         _state: ConnectionState = getattr(self.bot, "_connection")
-        for func in self.func:
-            _function = func.get("func")
-            if (_function.name == name or name in _function.aliases) and self.check_interaction(ctx, _function):
-                _state.dispatch("command", ctx)
-                if permission(_function.permission)(ctx):
-                    if parser.getboolean("Inspection", "inspection") and not permission(1)(ctx):
-                        await inspection(ctx)
-                        return
-                    try:
-                        await _function.callback(func.get("class"), ctx)
-                    except Exception as error:
-                        _state.dispatch("command_exception", ctx, error)
+        try:
+            for func in self.func:
+                _function = func.get("func")
+                if (_function.name == name or name in _function.aliases) and self.check_interaction(ctx, _function):
+                    # Dispatched listeners run as separate tasks and read ctx
+                    # after this coroutine resumes, so a context handed to any
+                    # listener must never return to the pool.
+                    if isinstance(ctx, SlashContext):
+                        ctx.detach()
+                    _state.dispatch("command", ctx)
+                    if permission(_function.permission)(ctx):
+                        if parser.getboolean("Inspection", "inspection") and not permission(1)(ctx):
+                            await inspection(ctx)
+                            return
+                        try:
+                            await _function.callback(func.get("class"), ctx)
+                        except Exception as error:
+                            _state.dispatch("command_exception", ctx, error)
+                        else:
+                            _state.dispatch("command_complete", ctx)
                     else:
-                        _state.dispatch("command_complete", ctx)
-                else:
-                    # On PUBG BOT, It won't make.
-                    _state.dispatch("command_permission_error", ctx)
-                break
+                        # On PUBG BOT, It won't make.
+                        _state.dispatch("command_permission_error", ctx)
+                    break
+        finally:
+            # Only contexts that matched no command — and were therefore
+            # never dispatched anywhere — are recycled.
+            if isinstance(ctx, SlashContext):
+                ctx.release()
         return
 
     @commands.Cog.listener()
@@ -94,9 +105,11 @@ class SocketReceive(commands.Cog):
         state: ConnectionState = getattr(self.bot, "_connection")
         if t == "INTERACTION_CREATE":
             if data.get("type") == 2:
-                result = SlashContext(data, self.bot)
+                result = SlashContext.acquire(data, self.bot)
                 state.dispatch('interaction_command', result)
             elif data.get("type") == 3:
+                # wait_for("components") consumers hold these beyond the
+                # dispatch, so pooling them would never pay off.
                 result = ComponentsContext(data, self.bot)
                 state.dispatch('components', result)
             return
@@ -10,7 +10,7 @@ from discord.ext import commands
 
 from module import commands as _command
 from utils.database import get_database
-from utils.perm import check_perm
+from utils.perm import check_perm, invalidate_ban
 from utils.prefix import get_prefix
 from utils.directory import directory
 
@@ -190,6 +190,7 @@ class Command:
             cur.execute(sql_Black, mention)
             connect.commit()
             connect.close()
+            invalidate_ban(mention)
             embed = discord.Embed(title="Blacklist!", description=f"{member}가 블랙리스트에 추가되었습니다!", color=self.color)
             await ctx.send(embed=embed)
             return
@@ -225,6 +226,7 @@ class Command:
             cur.execute(sql_delete, mention)
             connect.commit()
             connect.close()
+            invalidate_ban(mention)
             embed = discord.Embed(title="Blacklist!", description=f"{member}가 블랙리스트에서 제거되었습니다!", color=self.color)
             await ctx.send(embed=embed)
             return
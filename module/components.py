@@ -5,6 +5,12 @@ class Components:
     def __init__(self, components_type: int):
         self.type = components_type
 
+    def to_dict(self) -> dict:
+        raise NotImplementedError
+
+    def to_payload(self) -> dict:
+        return self.to_dict()
+
 
 class ActionRow(Components):
     def __init__(self, components: list = None):
@@ -24,6 +30,9 @@ class ActionRow(Components):
             "components": [i.to_dict() for i in self.components]
         }
 
+    def to_payload(self) -> dict:
+        return self.to_all_dict()
+
     def from_dict(self, payload: dict):
         self.components = payload.get("components")
         return self
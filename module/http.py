@@ -1,6 +1,20 @@
 import discord
 from discord.http import Route
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _to_json(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    # discord.http.HTTPClient.request and _files_to_form both serialize
+    # payloads through discord.utils.to_json, so rebinding it here swaps
+    # every outgoing payload onto the C encoder.
+    discord.utils.to_json = _to_json
+
 
 class SlashRoute(Route):
     BASE = "https://discord.com/api/v9"
@@ -22,8 +36,11 @@ class HttpClient:
         r = SlashRoute("POST", "/interactions/{id}/{token}/callback", id=self.data.id, token=self.data.token)
         await self.http.request(r, json=payload)
 
-    async def post_initial_response(self, payload: dict):
-        r = SlashRoute("POST", "/interactions/{id}/{token}/callback", id=self.data.id, token=self.data.token)
+    async def post_initial_response(self, payload: dict, with_response: bool = False):
+        path = "/interactions/{id}/{token}/callback"
+        if with_response:
+            path += "?with_response=true"
+        r = SlashRoute("POST", path, id=self.data.id, token=self.data.token)
         data = {"type": 4, "data": payload}
         return await self.http.request(r, json=data)
 
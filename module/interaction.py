@@ -1,3 +1,4 @@
+import contextlib
 import discord
 import logging
 
@@ -13,68 +14,124 @@ from utils.prefix import get_prefix
 
 log = logging.getLogger()
 
+_snowflake_time = discord.utils.snowflake_time
+
+
+def _get_payload(
+        content=None,
+        tts: bool = False,
+        embed=None,
+        hidden: bool = False,
+        allowed_mentions=None,
+        components=None
+) -> dict:
+    payload = {
+        'content': content,
+        'tts': tts,
+        'embeds': embed,
+        'allowed_mentions': allowed_mentions,
+        'components': components
+    }
+    payload = {key: value for key, value in payload.items() if value}
+    if hidden:
+        payload['flags'] = 1 << 6
+    return payload
+
 
 class InteractionContext:
+    __slots__ = (
+        'client', 'id', 'version', 'type', 'token', 'application', '_state',
+        'guild_id', 'channel_id', 'guild', 'channel', 'author_id',
+        '_author', '_author_payload', 'created_at',
+        'deferred', 'responded', '_http', '_prefix', '_detached'
+    )
+
+    _pool: list = []
+    _pool_size = 256
+
     def __init__(self, payload: dict, client: discord.Client):
+        self._detached = False
+        self._reinit(payload, client)
+
+    @classmethod
+    def acquire(cls, payload: dict, client: discord.Client):
+        if cls._pool:
+            context = cls._pool.pop()
+            context._detached = False
+            context._reinit(payload, client)
+            return context
+        return cls(payload, client)
+
+    def release(self):
+        if self._detached:
+            return
+        cls = type(self)
+        if len(cls._pool) < cls._pool_size:
+            for klass in cls.__mro__:
+                for name in getattr(klass, "__slots__", ()):
+                    setattr(self, name, None)
+            self._detached = True
+            cls._pool.append(self)
+
+    def detach(self):
+        self._detached = True
+
+    def _reinit(self, payload: dict, client: discord.Client):
+        get = payload.get
         self.client = client
-        self.id: int = getattr(discord.utils, "_get_as_snowflake")(payload, "id")
-        self.version = payload.get("version")
-        self.type = payload.get("type")
-        self.token = payload.get("token")
-        self.application = getattr(discord.utils, "_get_as_snowflake")(payload, "application_id")
+        self.id: int = int(payload["id"])
+        self.version = get("version")
+        self.type = get("type")
+        self.token = get("token")
+        self.application = int(payload["application_id"])
 
-        self._state: ConnectionState = getattr(client, "_connection")
+        self._state: ConnectionState = client._connection
 
-        self.guild_id = payload.get("guild_id")
-        self.channel_id = payload.get("channel_id")
+        self.guild_id = get("guild_id")
+        self.channel_id = get("channel_id")
         if self.guild_id is not None:
-            self.guild: Optional[discord.Guild] = self.client.get_guild(int(self.guild_id))
+            self.guild: Optional[discord.Guild] = client.get_guild(int(self.guild_id))
         else:
             self.guild: Optional[discord.Guild] = None
         self.channel = self._state.get_channel(int(self.channel_id))
 
-        if self.guild is not None:
-            member = payload.get("member")
-            self.author = discord.Member(data=member, state=self._state, guild=self.guild)
+        author_data = get("member") if self.guild is not None else get("user")
+        self._author_payload = author_data
+        self._author = None
+        if author_data is not None:
+            self.author_id = int(author_data.get("user", author_data)["id"])
         else:
-            user = payload.get("user")
-            self.author = discord.User(data=user, state=self._state)
-        self.created_at = discord.utils.snowflake_time(self.id)
+            self.author_id = None
+        self.created_at = _snowflake_time(self.id)
 
         self.deferred = False
         self.responded = False
+        self._http = None
+        self._prefix = None
 
-        data = InteractionData(interaction_token=self.token, interaction_id=self.id, application_id=self.application)
-        self.http = HttpClient(http=self.client.http, data=data)
+    @property
+    def author(self) -> Optional[Union[discord.Member, discord.User]]:
+        if self._author is None and self._author_payload is not None:
+            if self.guild is not None:
+                self._author = discord.Member(data=self._author_payload, state=self._state, guild=self.guild)
+            else:
+                self._author = discord.User(data=self._author_payload, state=self._state)
+        return self._author
 
     @property
-    def prefix(self):
-        return get_prefix(None, self)[0]
+    def http(self) -> HttpClient:
+        if self._http is None:
+            data = InteractionData(
+                interaction_token=self.token, interaction_id=self.id, application_id=self.application
+            )
+            self._http = HttpClient(http=self.client.http, data=data)
+        return self._http
 
-    @staticmethod
-    def _get_payload(
-            content=None,
-            tts: bool = False,
-            embed=None,
-            hidden: bool = False,
-            allowed_mentions=None,
-            components=None
-    ) -> dict:
-
-        payload = {}
-        if content:
-            payload['content'] = content
-        if tts:
-            payload['tts'] = tts
-        if embed:
-            payload['embeds'] = embed
-        if allowed_mentions:
-            payload['allowed_mentions'] = allowed_mentions
-        if hidden:
-            payload['flags'] = 1 << 6
-        if components:
-            payload['components'] = components
-        return payload
+    @property
+    def prefix(self):
+        if self._prefix is None:
+            self._prefix = get_prefix(None, self)[0]
+        return self._prefix
 
     async def defer(self, hidden: bool = False):
         base = {"type": 5}
@@ -107,14 +164,14 @@ class InteractionContext:
         if embed is not None:
             embeds = [embed]
         if embeds is not None:
-            embeds = [embed.to_dict() for embed in embeds]
+            embeds = list(map(discord.Embed.to_dict, embeds))
         if file:
             files = [file]
         if components is not None:
-            components = [i.to_all_dict() if isinstance(i, ActionRow) else i.to_dict() for i in components]
+            components = [i.to_payload() for i in components]
 
         allowed_mentions = _allowed_mentions(self._state, allowed_mentions)
-        payload = self._get_payload(
+        payload = _get_payload(
             content=content,
             embed=embeds,
             tts=tts,
@@ -123,28 +180,29 @@ class InteractionContext:
             components=components,
         )
 
-        if files:
-            form = _files_to_form(files=files, payload=payload)
-        else:
-            form = None
-
-        if not self.responded:
+        with contextlib.ExitStack() as stack:
             if files:
-                await self.defer(hidden=hidden)
-
-            if self.deferred:
-                resp = await self.http.edit_initial_response(payload=payload, form=form, files=files)
+                for i in files:
+                    stack.callback(i.close)
+                form = _files_to_form(files=files, payload=payload)
             else:
-                await self.http.post_initial_response(payload=payload)
-                resp = await self.http.get_initial_response()
-            self.responded = True
-        else:
-            resp = await self.http.post_followup(payload=payload, form=form, files=files)
-        ret = Message(state=self._state, channel=self.channel, data=resp)
+                form = None
 
-        if files:
-            for i in files:
-                i.close()
+            if not self.responded:
+                if files:
+                    await self.defer(hidden=hidden)
+
+                if self.deferred:
+                    resp = await self.http.edit_initial_response(payload=payload, form=form, files=files)
+                else:
+                    resp = await self.http.post_initial_response(payload=payload, with_response=True)
+                    resp = resp.get("resource", {}).get("message") if isinstance(resp, dict) else None
+                    if resp is None:
+                        resp = await self.http.get_initial_response()
+                self.responded = True
+            else:
+                resp = await self.http.post_followup(payload=payload, form=form, files=files)
+            ret = Message(state=self._state, channel=self.channel, data=resp)
         return ret
 
     async def edit(
@@ -168,35 +226,34 @@ class InteractionContext:
         if embed is not None:
             embeds = [embed]
         if embeds is not None:
-            embeds = [embed.to_dict() for embed in embeds]
+            embeds = list(map(discord.Embed.to_dict, embeds))
         if file:
             files = [file]
         if components is not None:
-            components = [i.to_all_dict() if isinstance(i, ActionRow) else i.to_dict() for i in components]
+            components = [i.to_payload() for i in components]
 
         allowed_mentions = _allowed_mentions(self._state, allowed_mentions)
 
-        payload = self._get_payload(
+        payload = _get_payload(
             content=content,
             embed=embeds,
             allowed_mentions=allowed_mentions,
             components=components,
         )
 
-        if files:
-            form = _files_to_form(files=files, payload=payload)
-        else:
-            form = None
-
-        if message_id == "@original":
-            resp = await self.http.edit_initial_response(payload=payload, form=form, files=files)
-        else:
-            resp = await self.http.edit_followup(message_id, payload=payload, form=form, files=files)
-        ret = Message(state=self._state, channel=self.channel, data=resp)
+        with contextlib.ExitStack() as stack:
+            if files:
+                for file in files:
+                    stack.callback(file.close)
+                form = _files_to_form(files=files, payload=payload)
+            else:
+                form = None
 
-        if files:
-            for file in files:
-                file.close()
+            if message_id == "@original":
+                resp = await self.http.edit_initial_response(payload=payload, form=form, files=files)
+            else:
+                resp = await self.http.edit_followup(message_id, payload=payload, form=form, files=files)
+            ret = Message(state=self._state, channel=self.channel, data=resp)
         return ret
 
     async def delete(self, message_id="@original"):
@@ -207,47 +264,76 @@ class InteractionContext:
         return
 
 
+def _opt_value(ctx, key, value, client, guild):
+    ctx.options[key] = value
+
+
+def _opt_boolean(ctx, key, value, client, guild):
+    ctx.options[key] = bool(value)
+
+
+def _opt_user(ctx, key, value, client, guild):
+    if guild is not None:
+        ctx.member = guild.get_member(value)
+    else:
+        ctx.member = client.get_user(value)
+
+
+def _opt_channel(ctx, key, value, client, guild):
+    if guild is not None:
+        ctx.options[key] = guild.get_channel(value)
+    else:
+        ctx.options[key] = value
+
+
+def _opt_role(ctx, key, value, client, guild):
+    ctx.options[key] = guild.get_role(value)
+
+
+def _opt_number(ctx, key, value, client, guild):
+    ctx.options[key] = float(value)
+
+
+_OPTION_HANDLERS = {
+    3: _opt_value,
+    4: _opt_value,
+    5: _opt_boolean,
+    6: _opt_user,
+    7: _opt_channel,
+    8: _opt_role,
+    10: _opt_number
+}
+
+
 class SlashContext(InteractionContext):
-    def __init__(self, payload: dict, client: discord.Client):
-        super().__init__(payload, client)
+    __slots__ = ('name', 'options', 'member')
+
+    _pool: list = []
+
+    def _reinit(self, payload: dict, client: discord.Client):
+        super()._reinit(payload, client)
         self.type = payload.get("type", 2)
         data = payload.get("data", {})
 
         self.name = data.get("name")
         self.options = {}
-        for option in data.get("options", []):
-            key = option.get("name")
-            value = option.get("value")
-            option_type = option.get("type")
-            if option_type == 3:
-                self.options[key]: str = value
-            elif option_type == 4:
-                self.options[key]: int = value
-            elif option_type == 5:
-                self.options[key] = bool(value)
-            elif option_type == 6:
-                if self.guild is not None:
-                    self.member = self.guild.get_member(value)
-                else:
-                    self.member = client.get_user(value)
-            elif option_type == 7 and self.guild is not None:
-                self.options[key] = self.guild.get_channel(value)
-            elif option_type == 8:
-                self.options[key]: discord.Role = self.guild.get_role(value)
-            elif option_type == 10:
-                self.options[key]: float = float(value)
-            else:
-                self.options[key] = value
+        handlers = _OPTION_HANDLERS
+        guild = self.guild
+        for option in data.get("options", ()):
+            handlers.get(option.get("type"), _opt_value)(self, option.get("name"), option.get("value"), client, guild)
 
     @property
     def content(self):
-        options = [str(self.options[i]) for i in self.options.keys()]
-        return f"/{self.name} {' '.join(options)}"
+        return f"/{self.name} {' '.join(map(str, self.options.values()))}"
 
 
 class ComponentsContext(InteractionContext):
-    def __init__(self, payload: dict, client: discord.Client):
-        super().__init__(payload, client)
+    __slots__ = ('custom_id', 'component_type', 'values', 'message')
+
+    _pool: list = []
+
+    def _reinit(self, payload: dict, client: discord.Client):
+        super()._reinit(payload, client)
         self.type = payload.get("type", 3)
         data = payload.get("data", {})
 
@@ -258,7 +344,16 @@ class ComponentsContext(InteractionContext):
         else:
             self.values: List[str] = []
 
-        self.message = Message(state=self._state, channel=self.channel, data=payload.get("message", {}))
+        message_data = payload.get("message", {})
+        message_author_id = message_data.get("author", {}).get("id")
+        if message_author_id is not None and int(message_author_id) == self.author_id:
+            prebuilt_author = self.author
+        else:
+            prebuilt_author = None
+        self.message = Message(
+            state=self._state, channel=self.channel, data=message_data,
+            prebuilt_author=prebuilt_author
+        )
 
     async def defer_update(self, hidden: bool = False):
         base = {"type": 6}
@@ -290,14 +385,14 @@ class ComponentsContext(InteractionContext):
         if embed is not None:
             embeds = [embed]
         if embeds is not None:
-            embeds = [embed.to_dict() for embed in embeds]
+            embeds = list(map(discord.Embed.to_dict, embeds))
         if file:
             files = [file]
         if components is not None:
-            components = [i.to_all_dict() if isinstance(i, ActionRow) else i.to_dict() for i in components]
+            components = [i.to_payload() for i in components]
 
         allowed_mentions = _allowed_mentions(self._state, allowed_mentions)
-        payload = self._get_payload(
+        payload = _get_payload(
             content=content,
             embed=embeds,
             tts=tts,
@@ -305,26 +400,25 @@ class ComponentsContext(InteractionContext):
             components=components,
         )
 
-        if files:
-            form = _files_to_form(files=files, payload=payload)
-        else:
-            form = None
-
-        if not self.responded:
+        with contextlib.ExitStack() as stack:
             if files:
-                await self.defer_update()
-
-            if self.deferred:
-                await self.http.edit_message(
-                    channel_id=self.channel.id, message_id=self.message.id,
-                    payload=payload, form=form, files=files
-                )
+                for i in files:
+                    stack.callback(i.close)
+                form = _files_to_form(files=files, payload=payload)
             else:
-                await self.http.post_initial_components_response(payload=payload)
-            self.responded = True
-        else:
-            await self.http.post_followup(payload=payload, form=form, files=files)
+                form = None
 
-        if files:
-            for i in files:
-                i.close()
+            if not self.responded:
+                if files:
+                    await self.defer_update()
+
+                if self.deferred:
+                    await self.http.edit_message(
+                        channel_id=self.channel.id, message_id=self.message.id,
+                        payload=payload, form=form, files=files
+                    )
+                else:
+                    await self.http.post_initial_components_response(payload=payload)
+                self.responded = True
+            else:
+                await self.http.post_followup(payload=payload, form=form, files=files)
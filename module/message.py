@@ -1,3 +1,4 @@
+import contextlib
 import discord
 
 from discord.state import ConnectionState
@@ -34,15 +35,23 @@ def _files_to_form(files: list, payload: dict):
     return form
 
 
+_default_allowed_mentions = (None, None)
+
+
 def _allowed_mentions(state, allowed_mentions):
+    global _default_allowed_mentions
     if allowed_mentions is not None:
         if state.allowed_mentions is not None:
-            allowed_mentions = state.allowed_mentions.merge(allowed_mentions).to_dict()
-        else:
-            allowed_mentions = allowed_mentions.to_dict()
-    else:
-        allowed_mentions = state.allowed_mentions and state.allowed_mentions.to_dict()
-    return allowed_mentions
+            return state.allowed_mentions.merge(allowed_mentions).to_dict()
+        return allowed_mentions.to_dict()
+
+    source = state.allowed_mentions
+    cached_source, cached = _default_allowed_mentions
+    if cached_source is source:
+        return cached
+    result = source and source.to_dict()
+    _default_allowed_mentions = (source, result)
+    return result
 
 
 class Message(discord.Message):
@@ -51,11 +60,20 @@ class Message(discord.Message):
             *,
             state: ConnectionState,
             channel: Union[discord.TextChannel, discord.DMChannel, discord.GroupChannel],
-            data: dict
+            data: dict,
+            prebuilt_author: Union[discord.Member, discord.User] = None
     ):
         if "message_reference" in data and "channel_id" not in data.get("message_reference", {}):
             data["message_reference"]["channel_id"] = channel.id
+        if prebuilt_author is not None:
+            author_id = data.get("author", {}).get("id")
+            if author_id is None or int(author_id) != prebuilt_author.id:
+                prebuilt_author = None
+        if prebuilt_author is not None:
+            data.pop("member", None)
         super().__init__(state=state, channel=channel, data=data)
+        if prebuilt_author is not None:
+            self.author = prebuilt_author
         self.components = from_payload(data.get("components", []))
         self.http = HttpClient(http=self._state.http)
 
@@ -116,11 +134,11 @@ class Message(discord.Message):
         if embed is not None:
             embeds = [embed]
         if embeds is not None:
-            embeds = [embed.to_dict() for embed in embeds]
+            embeds = list(map(discord.Embed.to_dict, embeds))
         if file:
             files = [file]
         if components is not None:
-            components = [i.to_all_dict() if isinstance(i, ActionRow) else i.to_dict() for i in components]
+            components = [i.to_payload() for i in components]
         allowed_mentions = _allowed_mentions(self._state, allowed_mentions)
 
         payload = self._get_payload(
@@ -131,16 +149,15 @@ class Message(discord.Message):
             components=components,
         )
 
-        if files:
-            form = _files_to_form(files=files, payload=payload)
-            resp = await self.http.create_message(form=form, files=files, channel_id=self.channel.id)
-        else:
-            resp = await self.http.create_message(payload=payload, channel_id=self.channel.id)
-        ret = Message(state=self._state, channel=self.channel, data=resp)
-
-        if files:
-            for i in files:
-                i.close()
+        with contextlib.ExitStack() as stack:
+            if files:
+                for i in files:
+                    stack.callback(i.close)
+                form = _files_to_form(files=files, payload=payload)
+                resp = await self.http.create_message(form=form, files=files, channel_id=self.channel.id)
+            else:
+                resp = await self.http.create_message(payload=payload, channel_id=self.channel.id)
+            ret = Message(state=self._state, channel=self.channel, data=resp)
         return ret
 
     async def edit(
@@ -163,11 +180,11 @@ class Message(discord.Message):
         if embed is not None:
             embeds = [embed]
         if embeds is not None:
-            embeds = [embed.to_dict() for embed in embeds]
+            embeds = list(map(discord.Embed.to_dict, embeds))
         if file:
             files = [file]
         if components is not None:
-            components = [i.to_all_dict() if isinstance(i, ActionRow) else i.to_dict() for i in components]
+            components = [i.to_payload() for i in components]
 
         allowed_mentions = _allowed_mentions(self._state, allowed_mentions)
 
@@ -178,18 +195,17 @@ class Message(discord.Message):
             components=components,
         )
 
-        if files:
-            payload["attachments"] = []
-            form = _files_to_form(files=files, payload=payload)
-        else:
-            form = None
-
-        await self.http.edit_message(
-            channel_id=self.channel.id, message_id=self.id,
-            payload=payload, form=form, files=files
-        )
-
-        if files:
-            for file in files:
-                file.close()
+        with contextlib.ExitStack() as stack:
+            if files:
+                for file in files:
+                    stack.callback(file.close)
+                payload["attachments"] = []
+                form = _files_to_form(files=files, payload=payload)
+            else:
+                form = None
+
+            await self.http.edit_message(
+                channel_id=self.channel.id, message_id=self.id,
+                payload=payload, form=form, files=files
+            )
         return
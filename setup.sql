@@ -6,7 +6,8 @@ CREATE TABLE IF NOT EXISTS PUBG_BOT (
     UniqueBots_token   varchar(300)    null,
 );
 CREATE TABLE IF NOT EXISTS BLACKLIST (
-    ID  bigint(20)  null
+    ID  bigint(20)  null,
+    INDEX (ID)
 );
 CREATE TABLE IF NOT EXISTS SERVER_INFO (
     id  bigint(20)  not null,
@@ -1,11 +1,51 @@
 import pymysql
 import logging
+import threading
 from config.config import parser
 
 log = logging.getLogger(__name__)
 
+_pool = []
+_pool_lock = threading.Lock()
+_pool_size = 8
 
-def get_database(database=None):
+
+class PooledConnection:
+    def __init__(self, connection, database=None):
+        self._connection = connection
+        self._database = database
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def close(self):
+        connection = self._connection
+        if connection is None:
+            return
+        self._connection = None
+        if self._database is None:
+            # pymysql runs with autocommit off, so an uncommitted read
+            # transaction would pin its snapshot across reuse and make every
+            # later query on this connection read stale data.
+            try:
+                connection.rollback()
+            except pymysql.err.Error:
+                connection.close()
+                return
+            with _pool_lock:
+                if len(_pool) < _pool_size:
+                    _pool.append(connection)
+                    return
+        connection.close()
+
+
+def _connect(database=None):
     for tries in ['MySQL1', 'MySQL2']:
         host = parser.get(tries, 'host')
         user = parser.get(tries, 'user')
@@ -20,3 +60,22 @@ def get_database(database=None):
         except pymysql.err.OperationalError:
             continue
         return connection
+
+
+def get_database(database=None):
+    if database is None:
+        while True:
+            with _pool_lock:
+                connection = _pool.pop() if _pool else None
+            if connection is None:
+                break
+            try:
+                connection.ping(reconnect=True)
+            except pymysql.err.Error:
+                connection.close()
+                continue
+            return PooledConnection(connection)
+    connection = _connect(database)
+    if connection is None:
+        return None
+    return PooledConnection(connection, database)
@@ -1,60 +1,87 @@
 import json
+import time
 
 from utils.database import get_database
 
 from config.config import parser
 
 
+_OWNERS = frozenset()
+_SUBOWNERS = frozenset()
+_PERM_MAP = {}
+
+
+def reload_permissions():
+    global _OWNERS, _SUBOWNERS, _PERM_MAP
+    _OWNERS = frozenset(int(i) for i in json.loads(parser.get("Permission", "Owner")))
+    _SUBOWNERS = frozenset(int(i) for i in json.loads(parser.get("Permission", "SubOwner")))
+    perm_map = {user_id: 2 for user_id in _SUBOWNERS}
+    perm_map.update({user_id: 1 for user_id in _OWNERS})
+    _PERM_MAP = perm_map
+
+
+reload_permissions()
+
+
 def is_owner(user_id):
-    owners = parser.get("Permission", "Owner")
-    for i in json.loads(owners):
-        if user_id == i:
-            return True
-    return False
+    return int(user_id) in _OWNERS
 
 
 def is_subowner(author):
-    owners = parser.get("Permission", "SubOwner")
-    for i in json.loads(owners):
-        if author == i:
-            return True
-    return False
+    return int(author) in _SUBOWNERS
 
 
 def is_admin(author):
-    for i in author.roles:
-        if i.permissions.administrator:
-            return True
-    return False
+    permissions = getattr(author, "guild_permissions", None)
+    return permissions is not None and permissions.administrator
+
+
+_ban_cache = {}
+_ban_cache_ttl = 60
+
+
+def invalidate_ban(user_id):
+    _ban_cache.pop(int(user_id), None)
 
 
 def is_banned(user_id):
+    user_id = int(user_id)
+    cached = _ban_cache.get(user_id)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
     connect = get_database()
     cur = connect.cursor()
-    sql = "select * from BLACKLIST"
-    cur.execute(sql)
-    banned_list = cur.fetchall()
+    sql = "select 1 from BLACKLIST where ID=%s limit 1"
+    cur.execute(sql, user_id)
+    banned = cur.fetchone() is not None
     connect.close()
-    for i in banned_list:
-        if i[0] == int(user_id):
-            return True
-    return False
+
+    if len(_ban_cache) >= 4096:
+        _ban_cache.clear()
+    _ban_cache[user_id] = (banned, time.monotonic() + _ban_cache_ttl)
+    return banned
 
 
 def check_perm(author):
-    if is_owner(author.id):
-        return 1
-    elif is_subowner(author.id):
-        return 2
-    elif is_admin(author):
-        return 3
-    elif is_banned(author.id):
+    level = _PERM_MAP.get(int(author.id))
+    if level is not None:
+        return level
+    if is_banned(author.id):
         return 9
-    else:
-        return 4
+    if is_admin(author):
+        return 3
+    return 4
 
 
 def permission(perm):
     def check(ctx):
+        author_id = getattr(ctx, "author_id", None)
+        if author_id is not None:
+            level = _PERM_MAP.get(author_id)
+            if level is None and is_banned(author_id):
+                level = 9
+            if level is not None:
+                return perm >= level
         return perm >= check_perm(ctx.author)
     return check
@@ -1,15 +1,27 @@
 import pymysql
 import json
+import time
 
 from utils.database import get_database
 from config.config import parser
 
 default_prefixes = list(json.loads(parser.get("DEFAULT", "default_prefixes")))
 
+_prefix_cache = {}
+_prefix_cache_ttl = 300
+
+
+def invalidate_prefix(guild_id):
+    _prefix_cache.pop(int(guild_id), None)
+
 
 def get_prefix(_, message):
     guild = message.guild
     if guild:
+        cached = _prefix_cache.get(guild.id)
+        if cached is not None and cached[1] > time.monotonic():
+            return [cached[0]]
+
         connect = get_database()
         cur = connect.cursor(pymysql.cursors.DictCursor)
         sql_prefix = pymysql.escape_string(f"select prefix from SERVER_INFO where ID={guild.id}")
@@ -23,6 +35,10 @@ def get_prefix(_, message):
         except pymysql.err.InternalError:
             a_prefix = default_prefixes[0]
         connect.close()
+
+        if len(_prefix_cache) >= 4096:
+            _prefix_cache.clear()
+        _prefix_cache[guild.id] = (a_prefix, time.monotonic() + _prefix_cache_ttl)
         return [a_prefix]
     else:
         return default_prefixes
@@ -50,3 +66,4 @@ def set_prefix(bot, guild, prefix):
         cur.execute(sql_prefix, (prefix, guild.id))
         connect.commit()
         connect.close()
+        invalidate_prefix(guild.id)